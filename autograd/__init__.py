@@ -4,7 +4,7 @@
 from autograd.module import Module,  Linear
 from autograd.activation import ReLU, Tanh, Sigmoid, Softmax
 from autograd.parameter import Parameter
-from autograd.tensor import Tensor
+from autograd.tensor import Tensor, autocast
 from autograd.optim import SGD, Momentum, Adam, Optimizer_base
 from autograd.criterion import CrossEntropy_Loss, MSE_loss, L1_Loss, BinXEnt_Loss
 # from autograd.dataloader import Dataloader
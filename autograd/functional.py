@@ -2,7 +2,7 @@ from autograd.tensor import Tensor, Node, _log
 #import autograd
 #Tensor = autograd.tensor.Tensor
 import numpy as np
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 def tanh(t:Tensor) -> Tensor:
     #bugfix 14.3
@@ -59,7 +59,50 @@ def softmax(t:Tensor, dim=1) -> Tensor:
     #TODO does not work with batch_size > 1
     return exp(t) / (exp(t)).sum(axis=dim)
 
-def mse(predicted:Tensor, actual:Tensor, is_one_hot = True) -> Tensor: 
+def checkpoint(fn:Callable[..., Tensor], *inputs:Tensor) -> Tensor:
+    r'''Trade compute for activation memory: run fn on detached copies of
+        inputs so none of its intermediate tensors are kept alive by grad_fn
+        closures, then re-run it (with grad tracking) when the backward pass
+        reaches this node.
+
+        Args:
+            fn: a function of Tensors returning a single Tensor
+            inputs (Tensor): the tensors fn is applied to
+
+        Returns:
+            A tensor with the same data fn(*inputs) would produce, whose
+            backward recomputes fn once and routes the gradients to inputs
+
+        Note: fn is executed twice when gradients are required, costing one
+        extra forward pass of the checkpointed segment.'''
+    detached = [Tensor(t.data) for t in inputs]
+    output = fn(*detached)
+    requires_grad = any(t.requires_grad for t in inputs)
+    if not requires_grad:
+        return Tensor(output.data, False, [])
+
+    # every input edge shares one recomputation, memoized per backward grad;
+    # the memo holds the grad object itself so a recycled id from a later
+    # backward call can never be mistaken for a hit
+    cache:list = []
+    def make_grad_fn(index:int):
+        def grad_fn(grad:np.ndarray) -> np.ndarray:
+            if not cache or cache[0] is not grad:
+                recomputed = [Tensor(t.data, requires_grad=True) for t in inputs]
+                re_output = fn(*recomputed)
+                re_output._backward(grad)
+                # inputs fn never used receive a zero gradient instead of None
+                cache[:] = [grad,
+                            [t.grad.data if t.grad is not None else np.zeros_like(t.data)
+                             for t in recomputed]]
+            return cache[1][index]
+        return grad_fn
+
+    parent_nodes = [Node(t, make_grad_fn(i))
+                    for i, t in enumerate(inputs) if t.requires_grad]
+    return Tensor(output.data, True, parent_nodes)
+
+def mse(predicted:Tensor, actual:Tensor, is_one_hot = True) -> Tensor:
     if not is_one_hot:
         actual = one_hot_encode(actual, 10)
     errors = predicted - actual
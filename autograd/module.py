@@ -267,7 +267,7 @@ class Module:
         '''Zero out every parameter's gradient that is stored in this optimizer'''
         for name, parameter in self.named_parameters():
             if set_to_none:
-                parameter.grad = None
+                parameter.release_grad()
             else:
                 # print(f'set parameter \"{name}  .grad.zero_grad()')
                 parameter.zero_grad()
@@ -1,15 +1,107 @@
 from warnings import warn
+from contextlib import contextmanager
 import numpy as np
-from typing import List, NamedTuple, Callable, Optional, Union
+from typing import Dict, List, NamedTuple, Callable, Optional, Tuple, Union
 
 Array_like = Union[float, list, np.ndarray]
 Tensorable = Union['Tensor', float, np.ndarray]
 
-def ensure_array(array_like:Array_like):
-    if isinstance(array_like, np.ndarray):
+# dtype applied to newly created tensors when none is given explicitly;
+# None keeps numpy's own inference
+_default_dtype:Optional[np.dtype] = None
+
+@contextmanager
+def autocast(dtype=np.float16):
+    '''Store the data of tensors created inside the block in a reduced
+        precision dtype, halving memory traffic on the bandwidth-bound
+        elementwise ops. Gradient buffers stay in float64 for stability.'''
+    global _default_dtype
+    previous = _default_dtype
+    _default_dtype = np.dtype(dtype)
+    try:
+        yield
+    finally:
+        _default_dtype = previous
+
+# numba is optional - when it is missing every kernel below falls back to
+# plain numpy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# size-keyed free lists of ndarray buffers so training loops reuse
+# allocations instead of hitting the system allocator every step
+_buffer_pool:Dict[Tuple[tuple, np.dtype], List[np.ndarray]] = {}
+pool_hits = 0
+pool_misses = 0
+
+def _pool_get(shape:tuple, dtype=np.float64) -> np.ndarray:
+    '''Take a buffer of the given shape/dtype from the pool, allocating
+        only on a miss (contents are uninitialized either way)'''
+    global pool_hits, pool_misses
+    free = _buffer_pool.get((shape, np.dtype(dtype)))
+    if free:
+        pool_hits += 1
+        return free.pop()
+    pool_misses += 1
+    return np.empty(shape, dtype=dtype)
+
+def _pool_put(buffer:np.ndarray) -> None:
+    '''Return an owned buffer to the pool - the caller must hold the only
+        live reference to it'''
+    _buffer_pool.setdefault((buffer.shape, buffer.dtype), []).append(buffer)
+
+def _reduction_plan(out_shape:tuple, in_shape:tuple) -> tuple:
+    '''Forward-time broadcast analysis: which output axes an operand's
+        gradient must be summed over - the dims broadcasting prepended,
+        then the operand's own size-1 axes'''
+    added_axes = tuple(range(len(out_shape) - len(in_shape)))
+    broadcast_axes = tuple(i for i, dim in enumerate(in_shape) if dim == 1)
+    return added_axes, broadcast_axes
+
+def _reduce_broadcast(grad:np.ndarray, added_axes:tuple, broadcast_axes:tuple) -> np.ndarray:
+    '''Sum a backward gradient down to an operand's shape following a
+        precomputed _reduction_plan - no shape walks at gradient time'''
+    if added_axes:
+        grad = grad.sum(axis=added_axes)
+    if broadcast_axes:
+        grad = grad.sum(axis=broadcast_axes, keepdims=True)
+    return grad
+
+def _gemm(a:np.ndarray, b:np.ndarray) -> np.ndarray:
+    '''2-D matrix product routed straight to the BLAS gemm entry point
+        (np.dot) instead of the generic matmul ufunc machinery'''
+    return np.dot(a, b)
+
+def _mul_sum(a:np.ndarray, b:np.ndarray) -> np.ndarray:
+    '''Fused elementwise multiply + full reduction, the gradient of a
+        multiply whose operand was broadcast from a scalar'''
+    return np.array(np.multiply(a, b).sum())
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _mul_sum_jit(a, b):
+        a = np.ravel(a)
+        b = np.ravel(b)
+        acc = 0.
+        for i in range(a.size):
+            acc += a[i] * b[i]
+        return acc
+
+    def _mul_sum(a:np.ndarray, b:np.ndarray) -> np.ndarray:
+        if a.dtype == np.float16 or b.dtype == np.float16:
+            # numba cannot type float16 arrays, keep the numpy fallback
+            return np.array(np.multiply(a, b).sum())
+        return np.array(_mul_sum_jit(np.ascontiguousarray(a), np.ascontiguousarray(b)))
+
+def ensure_array(array_like:Array_like, dtype=None):
+    if dtype is None:
+        dtype = _default_dtype
+    if dtype is None and isinstance(array_like, np.ndarray):
         return array_like
-    else:
-        return np.array(array_like)
+    # asarray is a no-op when the dtype already matches
+    return np.asarray(array_like, dtype=dtype)
 
 def ensure_tensor(tensorable:Tensorable) -> 'Tensor':
     if isinstance(tensorable, Tensor):
@@ -25,20 +117,20 @@ class Tensor:
     def __init__(self,
                 data:Array_like,
                 requires_grad:bool = False,
-                parent_nodes:List[Node] = None) -> None:
-        self.data = ensure_array(data)
+                parent_nodes:List[Node] = None,
+                dtype = None) -> None:
+        self.data = ensure_array(data, dtype)
         self.requires_grad = requires_grad
-        self.parent_nodes = parent_nodes or []
+        # dependency edges stored as two parallel lists (structure-of-arrays)
+        # so the backward walk pays no NamedTuple unpacking per edge
+        parent_nodes = parent_nodes or []
+        self._parent_tensors:List['Tensor'] = [node.tensor for node in parent_nodes]
+        self._parent_fns:List[Callable[[np.ndarray], np.ndarray]] = [node.grad_fn for node in parent_nodes]
         #self.shape = self.data.shape
+        # the grad buffer is allocated lazily on the first backward
+        # accumulation (or an explicit zero_grad call)
         self.grad:Optional['Tensor'] = None
-
-        if self.requires_grad:
-            self.zero_grad()
     '''Properties'''
-    @property
-    def data(self) -> np.ndarray:
-        return self._data
-
     @property
     def size(self) -> int:
         return self.data.size
@@ -61,13 +153,18 @@ class Tensor:
     @property
     def dtype(self):
         return self.data.dtype
-    
-    @data.setter
-    def data(self, value):
-        self._data = value
-        # setting data invalidates the tensor gradient
-        #warn('Tensors are normally immutable - setting value invalidates it')
-        self.grad = None
+
+    @property
+    def parent_nodes(self) -> List[Node]:
+        '''Compatibility view of the parallel edge lists'''
+        return [Node(tensor, grad_fn)
+                for tensor, grad_fn in zip(self._parent_tensors, self._parent_fns)]
+
+    @parent_nodes.setter
+    def parent_nodes(self, nodes:List[Node]) -> None:
+        nodes = nodes or []
+        self._parent_tensors = [node.tensor for node in nodes]
+        self._parent_fns = [node.grad_fn for node in nodes]
 
     def __repr__(self):
         if self.data.size > 25:
@@ -83,9 +180,16 @@ class Tensor:
         return self.data.truth()
 
     def __add__(self, other:Tensorable) -> 'Tensor':
+        if isinstance(other, Tensor):
+            return _add(self, other)
+        if isinstance(other, (int, float)):
+            # skip Tensor construction and broadcast analysis for plain scalars
+            return _add_scalar(self, other)
         return _add(self, ensure_tensor(other))
 
     def __radd__(self, other:Tensorable) -> 'Tensor':
+        if isinstance(other, (int, float)):
+            return _add_scalar(self, other)
         return _add(ensure_tensor(other), self)
 
     def __iadd__(self, other:Tensorable) -> 'Tensor':
@@ -96,9 +200,15 @@ class Tensor:
         return _neg(self)
 
     def __mul__(self, other:Tensorable) -> 'Tensor':
+        if isinstance(other, Tensor):
+            return _multiply(self, other)
+        if isinstance(other, (int, float)):
+            return _mul_scalar(self, other)
         return _multiply(self, ensure_tensor(other))
 
     def __rmul__(self, other:Tensorable) -> 'Tensor':
+        if isinstance(other, (int, float)):
+            return _mul_scalar(self, other)
         return _multiply(ensure_tensor(other), self)
 
     def __imul__(self, other:Tensorable) -> 'Tensor':
@@ -116,8 +226,6 @@ class Tensor:
 
     def __isub__(self, other:Tensorable) -> 'Tensor':
         self.data = self.data - ensure_tensor(other).data
-        # invalidate gradient
-        self.grad = None
         return self
 
     def __truediv__(self, other:Tensorable) -> 'Tensor':
@@ -132,25 +240,107 @@ class Tensor:
         return _slice(self, idxs)
 
     def zero_grad(self) -> None:
-        self.grad = Tensor(np.zeros(self.data.shape))
+        if self.grad is None or self.grad.shape != self.shape:
+            buffer = _pool_get(self.data.shape)
+            buffer.fill(0)
+            # grad buffers stay float64 even under autocast
+            self.grad = Tensor(buffer, dtype=np.float64)
+        else:
+            # reuse the existing buffer instead of allocating a fresh one
+            self.grad.data.fill(0)
         assert self.grad is not None
 
+    def release_grad(self) -> None:
+        '''Drop the gradient and hand its buffer back to the pool'''
+        if self.grad is not None:
+            _pool_put(self.grad.data)
+            self.grad = None
+
     def backward(self, grad:'Tensor' = None) -> None:
         assert self.requires_grad, "called backwards on tensor that doesn't require gradient"
         if grad is None:
             if self.shape == ():
-                grad = Tensor(1.)
+                seed = np.array(1.)
             else:
                 raise RuntimeError('grad must a specified for a non-0-dim tensor')
-        # assert self.grad is not None
-        self.grad.data = self.grad.data + grad.data #type: ignore
-
-        for parent in self.parent_nodes:
-            backward_grad = parent.grad_fn(grad.data)
-            assert backward_grad is not None
-            if parent.tensor.grad is None:
-                raise RuntimeError("Parent tensor.grad is None", repr(parent.tensor))
-            parent.tensor.backward(Tensor(backward_grad))
+        else:
+            # unwrap once - the engine below deals only in ndarrays
+            seed = grad.data
+        self._backward(seed)
+
+    def _backward(self, grad:np.ndarray) -> None:
+        '''ndarray-only backward engine: walks the graph in reverse
+            topological order, accumulating raw ndarrays keyed by tensor
+            identity (no Tensor wrapper per edge)'''
+        grads = {id(self): grad}
+        for tensor in reversed(_toposort(self)):
+            backward_grad = grads.pop(id(tensor), None)
+            if backward_grad is None:
+                continue
+            if tensor.requires_grad:
+                if tensor.grad is None:
+                    # first accumulation owns a fresh (float) copy, broadcast
+                    # up to the tensor's shape like += into zeros would be
+                    tensor.grad = Tensor(np.array(
+                        np.broadcast_to(backward_grad, tensor.shape), dtype=np.float64),
+                        dtype=np.float64)
+                else:
+                    tensor.grad.data += backward_grad
+            for parent_tensor, grad_fn in zip(tensor._parent_tensors, tensor._parent_fns):
+                parent_grad = grad_fn(backward_grad)
+                assert parent_grad is not None
+                key = id(parent_tensor)
+                if key in grads:
+                    grads[key] = grads[key] + parent_grad
+                else:
+                    grads[key] = parent_grad
+
+    def compile_backward(self) -> Callable[[Optional['Tensor']], None]:
+        '''Trace the backward walk once into a flat program and return a
+            callable that replays it. The graph walk, identity-dict lookups
+            and visited bookkeeping are paid a single time; the replay is a
+            linear pass over slot-indexed buffers.
+
+            The program is only valid while the same forward graph (the same
+            Tensor objects) is reused - rebuild after constructing new ops.'''
+        assert self.requires_grad, "called compile_backward on tensor that doesn't require gradient"
+        order = list(reversed(_toposort(self)))
+        slot = {id(tensor): i for i, tensor in enumerate(order)}
+        program = [(tensor,
+                    [(slot[id(parent)], grad_fn)
+                     for parent, grad_fn in zip(tensor._parent_tensors, tensor._parent_fns)])
+                   for tensor in order]
+
+        def run(grad:'Tensor' = None) -> None:
+            if grad is None:
+                if self.shape == ():
+                    seed = np.array(1.)
+                else:
+                    raise RuntimeError('grad must a specified for a non-0-dim tensor')
+            else:
+                seed = grad.data
+            buffers:List[Optional[np.ndarray]] = [None] * len(program)
+            buffers[0] = seed
+            for i, (tensor, edges) in enumerate(program):
+                backward_grad = buffers[i]
+                if backward_grad is None:
+                    continue
+                buffers[i] = None
+                if tensor.requires_grad:
+                    if tensor.grad is None:
+                        tensor.grad = Tensor(np.array(
+                            np.broadcast_to(backward_grad, tensor.shape), dtype=np.float64),
+                            dtype=np.float64)
+                    else:
+                        tensor.grad.data += backward_grad
+                for j, grad_fn in edges:
+                    parent_grad = grad_fn(backward_grad)
+                    if buffers[j] is None:
+                        buffers[j] = parent_grad
+                    else:
+                        buffers[j] = buffers[j] + parent_grad
+
+        return run
 
     '''[+++++O+++++] <{%}> - <~] Tensor operations [~> - <{%}> [+++++O+++++]'''
 
@@ -187,6 +377,28 @@ class Tensor:
     def view(self, *shape) -> 'Tensor':
         return _view(self, *shape)
 
+def _toposort(root:'Tensor') -> List['Tensor']:
+    '''Iterative depth-first search producing a post-order over the graph
+        reachable from root; each tensor appears exactly once even when it
+        feeds several downstream consumers, so a backward walk over the
+        reversed order does O(nodes+edges) work on diamond graphs'''
+    post_order:List['Tensor'] = []
+    visited = set()
+    stack = [(root, False)]
+    while stack:
+        tensor, expanded = stack.pop()
+        if expanded:
+            post_order.append(tensor)
+            continue
+        if id(tensor) in visited:
+            continue
+        visited.add(id(tensor))
+        stack.append((tensor, True))
+        for parent_tensor in tensor._parent_tensors:
+            if id(parent_tensor) not in visited:
+                stack.append((parent_tensor, False))
+    return post_order
+
 '''==============================TENSOR FUNCTIONS=============================='''
 
 def _tensor_sum(t: Tensor, axis:Optional[int] = None, keep_dims:bool = False) -> Tensor:
@@ -195,17 +407,17 @@ def _tensor_sum(t: Tensor, axis:Optional[int] = None, keep_dims:bool = False) ->
     requires_grad = t.requires_grad
 
     if requires_grad:
+        shape = t.data.shape
         def grad_fn(grad: np.ndarray) -> np.ndarray:
             if axis is None:
                 '''
                     grad is a zero-tensor so each element contributes that much
+                    broadcast_to gives a zero-copy view instead of materializing ones_like
                 '''
-                return grad * np.ones_like(t.data)
+                return np.broadcast_to(grad, shape)
             else:
                 ''' grad is a tensor that is the same shape as t.data minus the summed out axis'''
-                shape = t.shape[:axis]+t.shape[axis+1:]
-            
-                return grad * np.ones(shape)
+                return np.broadcast_to(grad, shape[:axis] + shape[axis+1:])
         parent_nodes = [Node(t, grad_fn)]
     else:
         parent_nodes = []
@@ -219,37 +431,23 @@ def _add(t1: Tensor, t2: Tensor) -> Tensor:
     data = t1.data + t2.data
     # if either component requires gradient computation, the sum must require it too
     requires_grad = t1.requires_grad or t2.requires_grad
+    if not requires_grad:
+        # common inference path: skip building any grad_fn closures
+        return Tensor(data, False, [])
     parent_nodes:List[Node] = []
 
     if t1.requires_grad:
+        # precompute the reduction plan once at forward time
+        plan1 = _reduction_plan(data.shape, t1.shape)
         def grad_fn1(grad: np.ndarray) -> np.ndarray:
-            #sum out added dims
-            ndim_added = grad.ndim - t1.data.ndim
-            for _ in range(ndim_added):
-                grad = grad.sum(axis=0)
-            
-            # sum across broadcasted (but non-added-dims)
-            for i, dim in enumerate(t1.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            
-            return grad
+            return _reduce_broadcast(grad, *plan1)
 
         parent_nodes.append(Node(t1, grad_fn1))
 
     if t2.requires_grad:
+        plan2 = _reduction_plan(data.shape, t2.shape)
         def grad_fn2(grad: np.ndarray) -> np.ndarray:
-            #sum out added dims
-            ndim_added = grad.ndim - t2.data.ndim
-            for _ in range(ndim_added): 
-                grad = grad.sum(axis=0)
-            
-            # sum across broadcasted (but non-added-dims)
-            for i, dim in enumerate(t2.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-            
-            return grad
+            return _reduce_broadcast(grad, *plan2)
 
         parent_nodes.append(Node(t2, grad_fn2))
 
@@ -261,40 +459,60 @@ def _multiply(t1:Tensor, t2:Tensor) -> Tensor:
     # Dyf(x,y) = cy
     data = t1.data * t2.data
     requires_grad = t1.requires_grad or t2.requires_grad
+    if not requires_grad:
+        return Tensor(data, False, [])
     parent_nodes: List[Node] = []
 
     if t1.requires_grad:
+        scalar1 = t1.data.ndim == 0
+        plan1 = _reduction_plan(data.shape, t1.shape)
+        other_data1 = t2.data
         def grad_fn1(grad: np.ndarray) -> np.ndarray:
-            grad = grad * t2.data
-            ndim_added = grad.ndim - t1.data.ndim
-            for _ in range(ndim_added):
-                grad = grad.sum(axis=0)
-
-            for i, dim in enumerate(t1.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
+            if scalar1:
+                # scalar operand: multiply and reduction fuse into one kernel
+                return _mul_sum(grad, other_data1)
+            buffer = _pool_get(grad.shape, np.result_type(grad, other_data1))
+            np.multiply(grad, other_data1, out=buffer)
+            reduced = _reduce_broadcast(buffer, *plan1)
+            if reduced is not buffer:
+                # the sums produced a fresh array, the scratch can be recycled
+                _pool_put(buffer)
+            return reduced
 
-            return grad
-        
         parent_nodes.append(Node(t1, grad_fn1))
 
     if t2.requires_grad:
+        scalar2 = t2.data.ndim == 0
+        plan2 = _reduction_plan(data.shape, t2.shape)
+        other_data2 = t1.data
         def grad_fn2(grad: np.ndarray) -> np.ndarray:
-            grad = grad * t1.data
-            ndim_added = grad.ndim - t2.data.ndim
-            for _ in range(ndim_added):
-                grad = grad.sum(axis=0)
-
-            for i, dim in enumerate(t2.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
+            if scalar2:
+                return _mul_sum(grad, other_data2)
+            buffer = _pool_get(grad.shape, np.result_type(grad, other_data2))
+            np.multiply(grad, other_data2, out=buffer)
+            reduced = _reduce_broadcast(buffer, *plan2)
+            if reduced is not buffer:
+                _pool_put(buffer)
+            return reduced
 
-            return grad
-        
         parent_nodes.append(Node(t2, grad_fn2))
 
     return Tensor(data, requires_grad, parent_nodes)
 
+def _add_scalar(t: Tensor, scalar:float) -> Tensor:
+    # adding a python scalar never broadcasts the tensor, so the gradient
+    # passes straight through with no reduction plan
+    data = t.data + scalar
+    if not t.requires_grad:
+        return Tensor(data, False, [])
+    return Tensor(data, True, [Node(t, lambda grad: grad)])
+
+def _mul_scalar(t: Tensor, scalar:float) -> Tensor:
+    data = t.data * scalar
+    if not t.requires_grad:
+        return Tensor(data, False, [])
+    return Tensor(data, True, [Node(t, lambda grad: grad * scalar)])
+
 def _neg(t: Tensor) -> Tensor:
     data = -t.data
     requires_grad = t.requires_grad
@@ -307,7 +525,32 @@ def _neg(t: Tensor) -> Tensor:
     return Tensor(data, requires_grad, parent_nodes)
 
 def _sub(t1: Tensor, t2:Tensor) -> Tensor:
-    return _add(t1, _neg(t2))
+    # f(x, y) = x-y
+    # Dxf(x,y) = 1
+    # Dyf(x,y) = -1
+    # computed directly instead of _add(t1, _neg(t2)), which built an extra
+    # ndarray, closure and graph node per subtraction
+    data = t1.data - t2.data
+    requires_grad = t1.requires_grad or t2.requires_grad
+    if not requires_grad:
+        return Tensor(data, False, [])
+    parent_nodes:List[Node] = []
+
+    if t1.requires_grad:
+        plan1 = _reduction_plan(data.shape, t1.shape)
+        def grad_fn1(grad: np.ndarray) -> np.ndarray:
+            return _reduce_broadcast(grad, *plan1)
+
+        parent_nodes.append(Node(t1, grad_fn1))
+
+    if t2.requires_grad:
+        plan2 = _reduction_plan(data.shape, t2.shape)
+        def grad_fn2(grad: np.ndarray) -> np.ndarray:
+            return -_reduce_broadcast(grad, *plan2)
+
+        parent_nodes.append(Node(t2, grad_fn2))
+
+    return Tensor(data, requires_grad, parent_nodes)
 
 def _matmul(t1: Tensor, t2: Tensor) -> Tensor:
     """
@@ -320,20 +563,29 @@ def _matmul(t1: Tensor, t2: Tensor) -> Tensor:
     #if t1.data.ndim == 1:
     # print('matmul on', t1.shape, t2.shape)
     assert t1.ndim == 2 and t2.ndim == 2
-    data = t1.data @ t2.data
+    data = _gemm(t1.data, t2.data)
     requires_grad = t1.requires_grad or t2.requires_grad
+    if not requires_grad:
+        return Tensor(data, False, [])
 
     parent_nodes: List[Node] = []
 
+    # stash the raw ndarrays, not the Tensor wrappers, so backward touches
+    # no Tensor attributes
+    a = t1.data
+    b = t2.data
+
     if t1.requires_grad:
         def grad_fn1(grad: np.ndarray) -> np.ndarray:
-            return grad @ t2.data.T
+            # B.T is a strided view - _gemm takes the transpose at the BLAS
+            # level rather than materializing a copy
+            return _gemm(grad, b.T)
 
         parent_nodes.append(Node(t1, grad_fn1))
 
     if t2.requires_grad:
         def grad_fn2(grad: np.ndarray) -> np.ndarray:
-            return t1.data.T @ grad
+            return _gemm(a.T, grad)
         parent_nodes.append(Node(t2, grad_fn2))
 
     return Tensor(data,
@@ -349,37 +601,23 @@ def _truediv(t1:Tensor, t2:Tensor) -> Tensor:
 
     data = t1.data / t2.data
     requires_grad = t1.requires_grad or t2.requires_grad
+    if not requires_grad:
+        return Tensor(data, False, [])
     parent_nodes: List[Node] = []
 
     if t1.requires_grad:
+        plan1 = _reduction_plan(data.shape, t1.shape)
         def grad_fn1(grad: np.ndarray) -> np.ndarray:
-            # D x/c 
-            grad = grad / t2.data
-            ndim_added = grad.ndim - t1.data.ndim
-            for _ in range(ndim_added):
-                grad = grad.sum(axis=0)
+            # D x/c
+            return _reduce_broadcast(grad / t2.data, *plan1)
 
-            for i, dim in enumerate(t1.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
-
-            return grad
-        
         parent_nodes.append(Node(t1, grad_fn1))
 
     if t2.requires_grad:
+        plan2 = _reduction_plan(data.shape, t2.shape)
         def grad_fn2(grad: np.ndarray) -> np.ndarray:
-            grad = grad * -(t1.data / (t2.data ** 2))
-            ndim_added = grad.ndim - t2.data.ndim
-            for _ in range(ndim_added):
-                grad = grad.sum(axis=0)
-
-            for i, dim in enumerate(t2.shape):
-                if dim == 1:
-                    grad = grad.sum(axis=i, keepdims=True)
+            return _reduce_broadcast(grad * -(t1.data / (t2.data ** 2)), *plan2)
 
-            return grad
-        
         parent_nodes.append(Node(t2, grad_fn2))
 
     return Tensor(data, requires_grad, parent_nodes)
@@ -389,12 +627,16 @@ def _slice(t: Tensor, idxs) -> Tensor:
     requires_grad = t.requires_grad
 
     if requires_grad:
+        # the gradient buffer must be the shape of the source tensor,
+        # not of the sliced output
+        shape = t.data.shape
+        dtype = t.data.dtype
         def grad_fn(grad: np.ndarray) -> np.ndarray:
-            bigger_grad = np.zeros_like(data)
+            bigger_grad = np.zeros(shape, dtype=dtype)
             bigger_grad[idxs] = grad
             return bigger_grad
 
-        parent_nodes = Node(t, grad_fn)
+        parent_nodes = [Node(t, grad_fn)]
     else:
         parent_nodes = []
 
@@ -0,0 +1,41 @@
+import unittest
+import pytest
+import numpy as np
+
+from autograd.tensor import Tensor, autocast
+
+class TestAutocast(unittest.TestCase):
+    def test_activations_reduced_grads_full(self):
+        with autocast():
+            t1 = Tensor([1., 2., 3.], requires_grad=True)
+            t2 = Tensor([4., 5., 6.], requires_grad=True)
+            out = (t1 * t2).sum()
+            assert t1.dtype == np.float16
+            assert out.dtype == np.float16
+
+            out.backward()
+
+        # gradient buffers stay full precision
+        assert t1.grad.dtype == np.float64
+        assert t1.grad.data.tolist() == [4., 5., 6.]
+
+    def test_scalar_multiply_under_autocast(self):
+        # exercises the fused _mul_sum gradient path on float16 activations,
+        # which must not hit the numba kernel (it cannot type float16)
+        with autocast():
+            s = Tensor(2., requires_grad=True)
+            v = Tensor([1., 2., 3.])
+            out = (s * v).sum()
+            out.backward()
+
+        assert float(s.grad.data) == 6.
+
+    def test_default_dtype_restored(self):
+        with autocast(np.float32):
+            assert Tensor([1, 2, 3]).dtype == np.float32
+        # back to numpy inference outside the block
+        assert Tensor([1, 2, 3]).dtype == np.array([1, 2, 3]).dtype
+
+    def test_explicit_dtype_argument(self):
+        t = Tensor([1, 2, 3], dtype=np.float32)
+        assert t.dtype == np.float32
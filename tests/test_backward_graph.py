@@ -0,0 +1,40 @@
+import unittest
+import pytest
+
+from autograd.tensor import Tensor, Node
+
+class TestBackwardGraph(unittest.TestCase):
+    def test_diamond_graph(self):
+        # x feeds two branches that rejoin - grads must accumulate once per path
+        x = Tensor([1., 2., 3.], requires_grad=True)
+
+        branch1 = x * 2.
+        branch2 = x * 3.
+        out = (branch1 + branch2).sum()
+
+        out.backward()
+
+        assert x.grad.data.tolist() == [5., 5., 5.]
+
+    def test_shared_node_visited_once(self):
+        # a tensor consumed by two downstream ops must have each of its
+        # grad_fns called exactly once, not once per path to the output
+        x = Tensor([1., 2.], requires_grad=True)
+        shared = x * x
+
+        calls = []
+        def counting(fn):
+            def wrapped(grad):
+                calls.append(1)
+                return fn(grad)
+            return wrapped
+        shared.parent_nodes = [Node(node.tensor, counting(node.grad_fn))
+                               for node in shared.parent_nodes]
+
+        out = (shared + shared).sum()
+        out.backward()
+
+        # one call per edge (x appears as both operands of shared)
+        assert len(calls) == 2
+        # d/dx of 2*x*x is 4x
+        assert x.grad.data.tolist() == [4., 8.]
@@ -0,0 +1,29 @@
+import unittest
+import pytest
+
+import autograd.tensor
+from autograd.tensor import Tensor
+
+class TestBufferPool(unittest.TestCase):
+    def test_released_buffer_is_reused(self):
+        t = Tensor([1., 2., 3.], requires_grad=True)
+        t.zero_grad()
+        buffer = t.grad.data
+
+        t.release_grad()
+        assert t.grad is None
+
+        hits_before = autograd.tensor.pool_hits
+        t.zero_grad()
+        # same allocation comes back out of the pool, zeroed
+        assert t.grad.data is buffer
+        assert t.grad.data.tolist() == [0., 0., 0.]
+        assert autograd.tensor.pool_hits == hits_before + 1
+
+    def test_zero_grad_reuses_existing_buffer(self):
+        t = Tensor([1., 2., 3.], requires_grad=True)
+        (t.sum()).backward()
+        buffer = t.grad.data
+        t.zero_grad()
+        assert t.grad.data is buffer
+        assert t.grad.data.tolist() == [0., 0., 0.]
@@ -0,0 +1,60 @@
+import unittest
+import pytest
+
+from autograd.tensor import Tensor
+from autograd.functional import checkpoint
+
+def segment(a, b):
+    return ((a * b) + a).sum()
+
+class TestCheckpoint(unittest.TestCase):
+    def test_checkpoint_matches_plain_backward(self):
+        a1 = Tensor([1., 2., 3.], requires_grad=True)
+        b1 = Tensor([4., 5., 6.], requires_grad=True)
+        out1 = segment(a1, b1)
+        out1.backward()
+
+        a2 = Tensor([1., 2., 3.], requires_grad=True)
+        b2 = Tensor([4., 5., 6.], requires_grad=True)
+        out2 = checkpoint(segment, a2, b2)
+        out2.backward()
+
+        assert out2.data.tolist() == out1.data.tolist()
+        assert a2.grad.data.tolist() == a1.grad.data.tolist()
+        assert b2.grad.data.tolist() == b1.grad.data.tolist()
+
+    def test_checkpoint_keeps_no_intermediate_graph(self):
+        a = Tensor([1., 2.], requires_grad=True)
+        out = checkpoint(lambda t: (t * t).sum(), a)
+        # only the edges back to the checkpoint inputs are retained
+        assert len(out.parent_nodes) == 1
+        out.backward()
+        assert a.grad.data.tolist() == [2., 4.]
+
+    def test_repeat_backward_with_different_grads(self):
+        # the recompute memo must not serve a stale entry when a later
+        # backward call's grad array recycles the id of an earlier one
+        a = Tensor([1., 2., 3.], requires_grad=True)
+        out = checkpoint(lambda t: t * 2., a).sum()
+
+        out.backward(Tensor(1.))
+        assert a.grad.data.tolist() == [2., 2., 2.]
+
+        a.zero_grad()
+        out.backward(Tensor(10.))
+        assert a.grad.data.tolist() == [20., 20., 20.]
+
+    def test_checkpoint_with_unused_input(self):
+        a = Tensor([1., 2.], requires_grad=True)
+        b = Tensor([3., 4.], requires_grad=True)
+        out = checkpoint(lambda x, y: (x * x).sum(), a, b)
+        out.backward()
+        assert a.grad.data.tolist() == [2., 4.]
+        # the unused input gets a zero gradient rather than crashing
+        assert b.grad.data.tolist() == [0., 0.]
+
+    def test_checkpoint_without_grad(self):
+        a = Tensor([1., 2.])
+        out = checkpoint(lambda t: (t * t).sum(), a)
+        assert not out.requires_grad
+        assert out.parent_nodes == []
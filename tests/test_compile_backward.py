@@ -0,0 +1,34 @@
+import unittest
+import pytest
+
+from autograd.tensor import Tensor
+
+class TestCompileBackward(unittest.TestCase):
+    def test_compiled_matches_backward(self):
+        x1 = Tensor([1., 2., 3.], requires_grad=True)
+        y1 = Tensor([4., 5., 6.], requires_grad=True)
+        out1 = (x1 * y1 + x1).sum()
+        out1.backward()
+
+        x2 = Tensor([1., 2., 3.], requires_grad=True)
+        y2 = Tensor([4., 5., 6.], requires_grad=True)
+        out2 = (x2 * y2 + x2).sum()
+        run = out2.compile_backward()
+        run()
+
+        assert x2.grad.data.tolist() == x1.grad.data.tolist()
+        assert y2.grad.data.tolist() == y1.grad.data.tolist()
+
+    def test_compiled_program_replays(self):
+        x = Tensor([1., 2.], requires_grad=True)
+        out = (x * x).sum()
+        run = out.compile_backward()
+
+        run()
+        assert x.grad.data.tolist() == [2., 4.]
+
+        # same program replays against the same graph after a reset
+        x.zero_grad()
+        out.zero_grad()
+        run()
+        assert x.grad.data.tolist() == [2., 4.]
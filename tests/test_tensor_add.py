@@ -18,9 +18,14 @@ class TestTensorSum(unittest.TestCase):
         assert t2.grad.data.tolist() == [-1, -2, -3]
 
         t1 += 0.1
-        assert t1.grad is None
+        # in-place mutation no longer discards the gradient,
+        # invalidation is now an explicit zero_grad call
+        assert t1.grad.data.tolist() == [-1, -2, -3]
         assert t1.data.tolist() == [1.1, 2.1, 3.1]
 
+        t1.zero_grad()
+        assert t1.grad.data.tolist() == [0, 0, 0]
+
     def test_broadcast_add(self):
         # What is broadcasting? A couple of things:
         # If I do t1 + t2 and t1.shape == t2.shape, it's obvious what to do.
@@ -20,7 +20,8 @@ class TestTensorMul(unittest.TestCase):
         assert t2.grad.data.tolist() == [-1,  -4,  -9]
 
         t1 *= 0.1
-        assert t1.grad is None
+        # in-place mutation no longer discards the gradient
+        assert t1.grad.data.tolist() == [-4, -10, -18]
 
         np.testing.assert_array_almost_equal(t1.data, [0.1, 0.2, 0.3])
 
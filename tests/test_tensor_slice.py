@@ -0,0 +1,28 @@
+import unittest
+import pytest
+
+from autograd.tensor import Tensor
+
+class TestTensorSlice(unittest.TestCase):
+    def test_simple_slice(self):
+        t1 = Tensor([1., 2., 3., 4.], requires_grad=True)
+
+        t2 = t1[1:3]
+
+        assert t2.data.tolist() == [2., 3.]
+
+        t2.backward(Tensor([-1., -2.]))
+
+        # gradient scatters back into a zero array the shape of the source
+        assert t1.grad.data.tolist() == [0., -1., -2., 0.]
+
+    def test_slice_2d(self):
+        t1 = Tensor([[1., 2., 3.], [4., 5., 6.]], requires_grad=True)
+
+        t2 = t1[0]
+
+        assert t2.data.tolist() == [1., 2., 3.]
+
+        t2.backward(Tensor([1., 1., 1.]))
+
+        assert t1.grad.data.tolist() == [[1., 1., 1.], [0., 0., 0.]]
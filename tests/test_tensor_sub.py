@@ -17,7 +17,8 @@ class TestTensorSub(unittest.TestCase):
         assert t2.grad.data.tolist() == [+1, +2, +3]
 
         t1 -= 0.1
-        assert t1.grad is None
+        # in-place mutation no longer discards the gradient
+        assert t1.grad.data.tolist() == [-1, -2, -3]
         assert t1.data.tolist() == [0.9, 1.9, 2.9]
 
 
@@ -18,8 +18,9 @@ class MyModule(Module):
 class TestZeroGrad(unittest.TestCase):
     def test_zero_grad(self):
         mod = MyModule()
+        # grad buffers are allocated lazily, nothing exists before backward
         for parameter in mod.parameters():
-            assert parameter.grad.data.max() == 0
+            assert parameter.grad is None
         optim = SGD(mod.parameters())
         output = mod(Tensor([1, 1, 1, 1, 1], requires_grad=True))
         output = (output / 2).sum()